@@ -799,6 +799,9 @@ impl HybridStaticBundler {
             // 2. It's never imported directly (only from X import Y style)
             // 3. It's not imported as a namespace
             // 4. It doesn't have function-scoped imports (from import rewriting)
+            // Inlined modules get no init function or `types.ModuleType`: their
+            // symbols become top-level bundle bindings, so only modules that are
+            // observed as module objects pay for one
             let has_side_effects = Self::has_side_effects(ast);
             let is_directly_imported = directly_imported_modules.contains(module_name);
             let has_function_imports = modules_with_function_imports.contains(module_name);
@@ -1056,7 +1059,10 @@ impl HybridStaticBundler {
             final_body.extend(self.generate_registries_and_hook());
         }
 
-        // Initialize wrapper modules in dependency order AFTER inlined modules are defined
+        // Initialize wrapper modules in dependency order AFTER inlined modules are defined.
+        // This has to stay eager: rewritten imports read `sys.modules['name']` directly
+        // instead of going through the import system, so CriboBundledFinder never gets
+        // a chance to initialize a module on first use.
         if need_sys_import {
             for (module_name, _, _) in params.sorted_modules {
                 if module_name == params.entry_module_name {
@@ -1224,12 +1230,7 @@ impl HybridStaticBundler {
         };
 
         // Apply renames to class body - classes don't create new scopes for globals
-        // We need to create a temporary Stmt to pass to rewrite_aliases_in_stmt
-        let mut temp_stmt = Stmt::ClassDef(class_def.clone());
-        self.rewrite_aliases_in_stmt(&mut temp_stmt, entry_module_renames);
-        if let Stmt::ClassDef(updated_class) = temp_stmt {
-            *class_def = updated_class;
-        }
+        self.rewrite_aliases_in_class(class_def, entry_module_renames);
 
         if needs_reassignment {
             Some((
@@ -1276,7 +1277,9 @@ impl HybridStaticBundler {
         let init_func_name = &self.init_functions[ctx.synthetic_name];
         let mut body = Vec::new();
 
-        // Check if module already exists in sys.modules
+        // Check if module already exists in sys.modules. This guard is what makes
+        // circular imports terminate: the module is registered before its body
+        // runs, so a re-entrant call returns the partially initialized module.
         body.push(self.create_module_exists_check(ctx.synthetic_name));
 
         // Create module object (returns multiple statements)
@@ -1706,55 +1709,67 @@ impl HybridStaticBundler {
 
         let mut find_spec_body = Vec::new();
 
-        // if fullname in self.module_registry:
-        let condition = Expr::Compare(ruff_python_ast::ExprCompare {
-            left: Box::new(Expr::Name(ExprName {
-                id: "fullname".into(),
-                ctx: ExprContext::Load,
-                range: TextRange::default(),
-            })),
-            ops: Box::from([ruff_python_ast::CmpOp::In]),
-            comparators: Box::from([Expr::Attribute(ExprAttribute {
-                value: Box::new(Expr::Name(ExprName {
-                    id: "self".into(),
-                    ctx: ExprContext::Load,
-                    range: TextRange::default(),
-                })),
-                attr: Identifier::new("module_registry", TextRange::default()),
-                ctx: ExprContext::Load,
-                range: TextRange::default(),
-            })]),
-            range: TextRange::default(),
-        });
-
-        let mut if_body = Vec::new();
-
-        // synthetic_name = self.module_registry[fullname]
-        if_body.push(Stmt::Assign(StmtAssign {
+        // synthetic_name = self.module_registry.get(fullname)
+        find_spec_body.push(Stmt::Assign(StmtAssign {
             targets: vec![Expr::Name(ExprName {
                 id: "synthetic_name".into(),
                 ctx: ExprContext::Store,
                 range: TextRange::default(),
             })],
-            value: Box::new(Expr::Subscript(ruff_python_ast::ExprSubscript {
-                value: Box::new(Expr::Attribute(ExprAttribute {
-                    value: Box::new(Expr::Name(ExprName {
-                        id: "self".into(),
+            value: Box::new(Expr::Call(ExprCall {
+                func: Box::new(Expr::Attribute(ExprAttribute {
+                    value: Box::new(Expr::Attribute(ExprAttribute {
+                        value: Box::new(Expr::Name(ExprName {
+                            id: "self".into(),
+                            ctx: ExprContext::Load,
+                            range: TextRange::default(),
+                        })),
+                        attr: Identifier::new("module_registry", TextRange::default()),
                         ctx: ExprContext::Load,
                         range: TextRange::default(),
                     })),
-                    attr: Identifier::new("module_registry", TextRange::default()),
+                    attr: Identifier::new("get", TextRange::default()),
                     ctx: ExprContext::Load,
                     range: TextRange::default(),
                 })),
-                slice: Box::new(Expr::Name(ExprName {
-                    id: "fullname".into(),
+                arguments: ruff_python_ast::Arguments {
+                    args: Box::from([Expr::Name(ExprName {
+                        id: "fullname".into(),
+                        ctx: ExprContext::Load,
+                        range: TextRange::default(),
+                    })]),
+                    keywords: Box::from([]),
+                    range: TextRange::default(),
+                },
+                range: TextRange::default(),
+            })),
+            range: TextRange::default(),
+        }));
+
+        // if synthetic_name is None:
+        //     return None
+        find_spec_body.push(Stmt::If(StmtIf {
+            test: Box::new(Expr::Compare(ruff_python_ast::ExprCompare {
+                left: Box::new(Expr::Name(ExprName {
+                    id: "synthetic_name".into(),
                     ctx: ExprContext::Load,
                     range: TextRange::default(),
                 })),
-                ctx: ExprContext::Load,
+                ops: Box::from([ruff_python_ast::CmpOp::Is]),
+                comparators: Box::from([Expr::NoneLiteral(ruff_python_ast::ExprNoneLiteral {
+                    range: TextRange::default(),
+                })]),
                 range: TextRange::default(),
             })),
+            body: vec![Stmt::Return(StmtReturn {
+                value: Some(Box::new(Expr::NoneLiteral(
+                    ruff_python_ast::ExprNoneLiteral {
+                        range: TextRange::default(),
+                    },
+                ))),
+                range: TextRange::default(),
+            })],
+            elif_else_clauses: vec![],
             range: TextRange::default(),
         }));
 
@@ -1852,7 +1867,7 @@ impl HybridStaticBundler {
             range: TextRange::default(),
         }));
 
-        if_body.push(Stmt::If(StmtIf {
+        find_spec_body.push(Stmt::If(StmtIf {
             test: Box::new(inner_condition),
             body: inner_if_body,
             elif_else_clauses: vec![],
@@ -1860,7 +1875,7 @@ impl HybridStaticBundler {
         }));
 
         // import importlib.util
-        if_body.push(Stmt::Import(StmtImport {
+        find_spec_body.push(Stmt::Import(StmtImport {
             names: vec![ruff_python_ast::Alias {
                 name: Identifier::new("importlib.util", TextRange::default()),
                 asname: None,
@@ -1870,7 +1885,7 @@ impl HybridStaticBundler {
         }));
 
         // return importlib.util.find_spec(synthetic_name)
-        if_body.push(Stmt::Return(StmtReturn {
+        find_spec_body.push(Stmt::Return(StmtReturn {
             value: Some(Box::new(Expr::Call(ExprCall {
                 func: Box::new(Expr::Attribute(ExprAttribute {
                     value: Box::new(Expr::Attribute(ExprAttribute {
@@ -1901,23 +1916,6 @@ impl HybridStaticBundler {
             range: TextRange::default(),
         }));
 
-        find_spec_body.push(Stmt::If(StmtIf {
-            test: Box::new(condition),
-            body: if_body,
-            elif_else_clauses: vec![],
-            range: TextRange::default(),
-        }));
-
-        // return None
-        find_spec_body.push(Stmt::Return(StmtReturn {
-            value: Some(Box::new(Expr::NoneLiteral(
-                ruff_python_ast::ExprNoneLiteral {
-                    range: TextRange::default(),
-                },
-            ))),
-            range: TextRange::default(),
-        }));
-
         let find_spec_method = Stmt::FunctionDef(StmtFunctionDef {
             name: Identifier::new("find_spec", TextRange::default()),
             type_params: None,
@@ -2125,6 +2123,9 @@ impl HybridStaticBundler {
     }
 
     /// Register module in sys.modules with original name as alias
+    ///
+    /// Rewritten imports look modules up as `sys.modules['<original>']`, so
+    /// every wrapper module is registered under its original name.
     fn create_sys_modules_registration_alias(
         &self,
         _synthetic_name: &str,
@@ -2156,6 +2157,10 @@ impl HybridStaticBundler {
     }
 
     /// Create module attribute assignment
+    ///
+    /// One `module.attr = attr` per symbol, emitted right after its definition
+    /// so the module is populated in source order (circular imports may read
+    /// it mid-body).
     fn create_module_attr_assignment(&self, module_var: &str, attr_name: &str) -> Stmt {
         Stmt::Assign(StmtAssign {
             targets: vec![Expr::Attribute(ExprAttribute {
@@ -2654,16 +2659,7 @@ impl HybridStaticBundler {
                 }
             }
             Stmt::ClassDef(class_def) => {
-                // Rewrite in base classes
-                if let Some(ref mut arguments) = class_def.arguments {
-                    for arg in &mut arguments.args {
-                        self.rewrite_aliases_in_expr(arg, alias_to_canonical);
-                    }
-                }
-                // Rewrite in class body
-                for stmt in &mut class_def.body {
-                    self.rewrite_aliases_in_stmt(stmt, alias_to_canonical);
-                }
+                self.rewrite_aliases_in_class(class_def, alias_to_canonical);
             }
             Stmt::If(if_stmt) => {
                 self.rewrite_aliases_in_expr(&mut if_stmt.test, alias_to_canonical);
@@ -2805,6 +2801,24 @@ impl HybridStaticBundler {
         }
     }
 
+    /// Rewrite aliases in a class definition's base classes and body in place
+    fn rewrite_aliases_in_class(
+        &self,
+        class_def: &mut StmtClassDef,
+        alias_to_canonical: &FxIndexMap<String, String>,
+    ) {
+        // Rewrite in base classes
+        if let Some(ref mut arguments) = class_def.arguments {
+            for arg in &mut arguments.args {
+                self.rewrite_aliases_in_expr(arg, alias_to_canonical);
+            }
+        }
+        // Rewrite in class body
+        for stmt in &mut class_def.body {
+            self.rewrite_aliases_in_stmt(stmt, alias_to_canonical);
+        }
+    }
+
     /// Recursively rewrite aliases in an expression
     fn rewrite_aliases_in_expr(
         &self,
@@ -2841,7 +2855,9 @@ fn rewrite_aliases_in_expr_impl(expr: &mut Expr, alias_to_canonical: &FxIndexMap
                     name_str,
                     canonical
                 );
-                name_expr.id = canonical.clone().into();
+                // Build the name straight from the table entry; short module
+                // names stay inline instead of round-tripping through a String
+                name_expr.id = canonical.as_str().into();
             }
         }
         Expr::Attribute(attr_expr) => {
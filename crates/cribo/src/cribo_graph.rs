@@ -120,8 +120,76 @@ pub struct UnusedImportInfo {
 struct ImportUsageContext<'a> {
     imported_name: &'a str,
     import_id: ItemId,
-    is_init_py: bool,
     import_data: &'a ItemData,
+    usage: &'a NameUsage<'a>,
+}
+
+/// Readers of a name within a module
+#[derive(Debug, Clone, Copy)]
+struct NameReaders {
+    /// First item found reading the name
+    first: ItemId,
+    /// Whether any other item also reads the name
+    shared: bool,
+}
+
+/// Name usage across a module, collected in a single pass over its items
+struct NameUsage<'a> {
+    /// Name -> items reading it (directly or eventually)
+    readers: FxHashMap<&'a str, NameReaders>,
+    /// Names listed in the module's `__all__`, if it has one
+    module_exports: Option<&'a FxHashSet<String>>,
+}
+
+impl<'a> NameUsage<'a> {
+    /// Collect read names and `__all__` exports from all items in one walk
+    fn collect(items: &'a FxHashMap<ItemId, ItemData>) -> Self {
+        let mut readers: FxHashMap<&'a str, NameReaders> = FxHashMap::default();
+        let mut module_exports = None;
+
+        for (item_id, item_data) in items {
+            for name in item_data
+                .read_vars
+                .iter()
+                .chain(&item_data.eventual_read_vars)
+            {
+                readers
+                    .entry(name.as_str())
+                    .and_modify(|entry| entry.shared |= entry.first != *item_id)
+                    .or_insert(NameReaders {
+                        first: *item_id,
+                        shared: false,
+                    });
+            }
+
+            // The parsed __all__ list values live in the assignment's reexported_names
+            if module_exports.is_none() {
+                if let ItemType::Assignment { targets } = &item_data.item_type {
+                    if targets.iter().any(|target| target == "__all__") {
+                        module_exports = Some(&item_data.reexported_names);
+                    }
+                }
+            }
+        }
+
+        Self {
+            readers,
+            module_exports,
+        }
+    }
+
+    /// Check if a name is read by any item other than `item_id`
+    fn is_read_outside(&self, name: &str, item_id: ItemId) -> bool {
+        self.readers
+            .get(name)
+            .is_some_and(|readers| readers.shared || readers.first != item_id)
+    }
+
+    /// Check if a name is in the module's __all__ export list
+    fn is_exported(&self, name: &str) -> bool {
+        self.module_exports
+            .is_some_and(|exports| exports.contains(name))
+    }
 }
 
 /// Data about a Python item (statement/definition)
@@ -259,6 +327,11 @@ impl ModuleDepGraph {
     pub fn find_unused_imports(&self, is_init_py: bool) -> Vec<UnusedImportInfo> {
         let mut unused_imports = Vec::new();
 
+        // In __init__.py, preserve all imports as they might be part of the public API
+        if is_init_py {
+            return unused_imports;
+        }
+
         // First, collect all imported names
         let mut imported_items: Vec<(ItemId, &ItemData)> = Vec::new();
         for (id, data) in &self.items {
@@ -271,17 +344,25 @@ impl ModuleDepGraph {
             }
         }
 
+        if imported_items.is_empty() {
+            return unused_imports;
+        }
+
+        // Collect every name read in the module once, instead of rescanning
+        // all items for each imported name
+        let usage = NameUsage::collect(&self.items);
+
         // For each imported name, check if it's used
         for (import_id, import_data) in imported_items {
             for imported_name in &import_data.imported_names {
                 let ctx = ImportUsageContext {
                     imported_name,
                     import_id,
-                    is_init_py,
                     import_data,
+                    usage: &usage,
                 };
 
-                if self.is_import_unused(ctx) {
+                if Self::is_import_unused(ctx) {
                     let module_name = match &import_data.item_type {
                         ItemType::Import { module, .. } => module.clone(),
                         ItemType::FromImport { module, .. } => module.clone(),
@@ -302,13 +383,7 @@ impl ModuleDepGraph {
     }
 
     /// Check if a specific imported name is unused
-    fn is_import_unused(&self, ctx: ImportUsageContext<'_>) -> bool {
-        // Check for special cases where imports should be preserved
-        if ctx.is_init_py {
-            // In __init__.py, preserve all imports as they might be part of the public API
-            return false;
-        }
-
+    fn is_import_unused(ctx: ImportUsageContext<'_>) -> bool {
         // Check if it's a star import
         if let ItemType::FromImport { is_star: true, .. } = &ctx.import_data.item_type {
             // Star imports are always preserved
@@ -325,48 +400,29 @@ impl ModuleDepGraph {
             return false;
         }
 
-        // Check if the name is used anywhere in the module
-        for (item_id, item_data) in &self.items {
-            // Skip the import statement itself
-            if *item_id == ctx.import_id {
-                continue;
-            }
-
-            // Check if the name is read by this item
-            if item_data.read_vars.contains(ctx.imported_name)
-                || item_data.eventual_read_vars.contains(ctx.imported_name)
-            {
-                log::trace!(
-                    "Import '{}' is used by item {:?} (read_vars: {:?}, eventual_read_vars: {:?})",
-                    ctx.imported_name,
-                    item_id,
-                    item_data.read_vars,
-                    item_data.eventual_read_vars
-                );
-                return false;
-            }
-
-            // For dotted imports like `import xml.etree.ElementTree`, also check if any of the
-            // declared variables from that import are used
-            if let Some(import_item) = self.items.get(&ctx.import_id) {
-                let is_var_used = import_item.var_decls.iter().any(|var_decl| {
-                    item_data.read_vars.contains(var_decl)
-                        || item_data.eventual_read_vars.contains(var_decl)
-                });
+        // Check if the name is used anywhere in the module (other than the import itself)
+        if ctx.usage.is_read_outside(ctx.imported_name, ctx.import_id) {
+            log::trace!("Import '{}' is used in the module", ctx.imported_name);
+            return false;
+        }
 
-                if is_var_used {
-                    log::trace!(
-                        "Import '{}' is used via declared variables by item {:?}",
-                        ctx.imported_name,
-                        item_id
-                    );
-                    return false;
-                }
-            }
+        // For dotted imports like `import xml.etree.ElementTree`, also check if any of the
+        // declared variables from that import are used
+        if ctx
+            .import_data
+            .var_decls
+            .iter()
+            .any(|var_decl| ctx.usage.is_read_outside(var_decl, ctx.import_id))
+        {
+            log::trace!(
+                "Import '{}' is used via declared variables",
+                ctx.imported_name
+            );
+            return false;
         }
 
         // Check if the name is in the module's __all__ export list
-        if self.is_in_module_exports(ctx.imported_name) {
+        if ctx.usage.is_exported(ctx.imported_name) {
             return false;
         }
 
@@ -374,21 +430,6 @@ impl ModuleDepGraph {
         true
     }
 
-    /// Check if a name is in the module's __all__ export list
-    fn is_in_module_exports(&self, name: &str) -> bool {
-        // Look for __all__ assignment
-        for item_data in self.items.values() {
-            if let ItemType::Assignment { targets } = &item_data.item_type {
-                if targets.contains(&"__all__".to_string()) {
-                    // Check if the name is in the reexported_names set
-                    // which contains the parsed __all__ list values
-                    return item_data.reexported_names.contains(name);
-                }
-            }
-        }
-        false
-    }
-
     /// Helper method to add dependencies to stack
     fn add_dependencies_to_stack(&self, current: &ItemId, stack: &mut Vec<ItemId>) {
         if let Some(deps) = self.deps.get(current) {
@@ -1609,4 +1650,49 @@ mod tests {
             panic!("Expected unresolvable strategy for constants cycle");
         }
     }
+
+    #[test]
+    fn test_find_unused_imports() {
+        let mut module = ModuleDepGraph::new(ModuleId::new(0), "main".to_string());
+
+        let import_item = |module_name: &str, vars: &[&str]| ItemData {
+            item_type: ItemType::Import {
+                module: module_name.into(),
+                alias: None,
+            },
+            var_decls: vars.iter().map(|v| (*v).to_string()).collect(),
+            read_vars: FxHashSet::default(),
+            eventual_read_vars: FxHashSet::default(),
+            write_vars: FxHashSet::default(),
+            eventual_write_vars: FxHashSet::default(),
+            has_side_effects: false,
+            span: Some((1, 1)),
+            imported_names: vars.iter().map(|v| (*v).to_string()).collect(),
+            reexported_names: FxHashSet::default(),
+        };
+
+        module.add_item(import_item("os", &["os"]));
+        module.add_item(import_item("sys", &["sys"]));
+
+        // Only `os` is read, and only inside a function body
+        module.add_item(ItemData {
+            item_type: ItemType::FunctionDef {
+                name: "main".into(),
+            },
+            var_decls: ["main".into()].into_iter().collect(),
+            read_vars: FxHashSet::default(),
+            eventual_read_vars: ["os".into()].into_iter().collect(),
+            write_vars: FxHashSet::default(),
+            eventual_write_vars: FxHashSet::default(),
+            has_side_effects: false,
+            span: Some((3, 4)),
+            imported_names: FxHashSet::default(),
+            reexported_names: FxHashSet::default(),
+        });
+
+        let unused = module.find_unused_imports(false);
+        assert_eq!(unused.len(), 1);
+        assert_eq!(unused[0].name, "sys");
+        assert!(module.find_unused_imports(true).is_empty());
+    }
 }
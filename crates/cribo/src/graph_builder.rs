@@ -954,19 +954,12 @@ impl<'a> GraphBuilder<'a> {
 
     /// Check if an import is for side effects
     fn is_side_effect_import(&self, module_name: &str) -> bool {
-        // Common patterns for side-effect imports
-        let side_effect_patterns = [
-            "logging.config",
-            "warnings.filterwarnings",
-            "multiprocessing.set_start_method",
-            "matplotlib.use",
-            "django.setup",
-            "pytest_django.plugin",
-        ];
-
-        side_effect_patterns
-            .iter()
-            .any(|&pattern| module_name.starts_with(pattern))
+        // A side-effect module also covers its submodules, so probe the table
+        // with the module name and each of its dotted parents
+        std::iter::successors(Some(module_name), |name| {
+            name.rsplit_once('.').map(|(parent, _)| parent)
+        })
+        .any(is_side_effect_module)
     }
 
     /// Extract a dotted name from an attribute expression
@@ -1069,3 +1062,40 @@ impl<'a> GraphBuilder<'a> {
         }
     }
 }
+
+/// Check if a module is one of the common patterns imported for side effects
+///
+/// The table holds exact module names; `is_side_effect_import` also matches
+/// their submodules by probing each dotted parent, so `logging.config.handlers`
+/// counts while `logging.configx` and `logging` do not.
+fn is_side_effect_module(module_name: &str) -> bool {
+    matches!(
+        module_name,
+        "logging.config"
+            | "warnings.filterwarnings"
+            | "multiprocessing.set_start_method"
+            | "matplotlib.use"
+            | "django.setup"
+            | "pytest_django.plugin"
+    )
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::cribo_graph::ModuleId;
+
+    #[test]
+    fn test_is_side_effect_import() {
+        let mut graph = ModuleDepGraph::new(ModuleId::new(0), "test".to_string());
+        let builder = GraphBuilder::new(&mut graph);
+
+        // Listed modules and their submodules are side-effect imports
+        assert!(builder.is_side_effect_import("logging.config"));
+        assert!(builder.is_side_effect_import("logging.config.handlers"));
+
+        // Names that only share a textual prefix, or a listed module's parent, are not
+        assert!(!builder.is_side_effect_import("logging.configx"));
+        assert!(!builder.is_side_effect_import("logging"));
+    }
+}
@@ -167,7 +167,7 @@ impl Drop for VirtualEnvGuard {
     }
 }
 
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, Copy, PartialEq)]
 pub enum ImportType {
     FirstParty,
     ThirdParty,
@@ -183,6 +183,9 @@ pub struct ModuleResolver {
     first_party_modules: IndexSet<String>,
     /// Cache of virtual environment packages to avoid repeated filesystem scans
     virtualenv_packages_cache: RefCell<Option<IndexSet<String>>>,
+    /// Cache of import classifications, as the same modules are classified
+    /// once per importing edge (repeatedly so in circular dependencies)
+    import_type_cache: RefCell<IndexMap<String, ImportType>>,
 }
 
 impl ModuleResolver {
@@ -211,6 +214,7 @@ impl ModuleResolver {
             module_cache: IndexMap::new(),
             first_party_modules: IndexSet::new(),
             virtualenv_packages_cache: RefCell::new(None),
+            import_type_cache: RefCell::new(IndexMap::new()),
         };
 
         resolver.discover_first_party_modules_with_overrides(
@@ -638,6 +642,27 @@ impl ModuleResolver {
 
     /// Classify an import as first-party, third-party, or standard library
     pub fn classify_import(&self, module_name: &str) -> ImportType {
+        // Check cache first
+        if let Some(import_type) = self
+            .import_type_cache
+            .try_borrow()
+            .ok()
+            .and_then(|cache| cache.get(module_name).copied())
+        {
+            return import_type;
+        }
+
+        let import_type = self.compute_import_type(module_name);
+
+        if let Ok(mut cache) = self.import_type_cache.try_borrow_mut() {
+            cache.insert(module_name.to_owned(), import_type);
+        }
+
+        import_type
+    }
+
+    /// Classify an import without consulting the cache
+    fn compute_import_type(&self, module_name: &str) -> ImportType {
         // Check if it's a relative import (starts with a dot)
         if module_name.starts_with('.') {
             return ImportType::FirstParty;
@@ -678,10 +703,13 @@ impl ModuleResolver {
         }
 
         // Check if any discovered module starts with this name (submodule)
-        for first_party_module in &self.first_party_modules {
-            if first_party_module.starts_with(&format!("{}.", module_name)) {
-                return true;
-            }
+        let submodule_prefix = format!("{}.", module_name);
+        if self
+            .first_party_modules
+            .iter()
+            .any(|first_party_module| first_party_module.starts_with(&submodule_prefix))
+        {
+            return true;
         }
 
         // Check if this is a submodule of any first-party module
@@ -789,6 +817,7 @@ mod tests {
             module_cache: IndexMap::new(),
             first_party_modules: IndexSet::new(),
             virtualenv_packages_cache: RefCell::new(None),
+            import_type_cache: RefCell::new(IndexMap::new()),
         };
         assert_eq!(
             resolver.path_to_module_name(src_dir, file_path),
@@ -807,6 +836,7 @@ mod tests {
             module_cache: IndexMap::new(),
             first_party_modules: IndexSet::new(),
             virtualenv_packages_cache: RefCell::new(None),
+            import_type_cache: RefCell::new(IndexMap::new()),
         };
 
         // Use scope guard to safely set PYTHONPATH for testing
@@ -840,6 +870,7 @@ mod tests {
             module_cache: IndexMap::new(),
             first_party_modules: IndexSet::new(),
             virtualenv_packages_cache: RefCell::new(None),
+            import_type_cache: RefCell::new(IndexMap::new()),
         };
 
         // Use scope guard to ensure PYTHONPATH is not set
@@ -852,4 +883,25 @@ mod tests {
         assert!(scan_dirs.contains(&PathBuf::from("/src1")));
         assert!(scan_dirs.contains(&PathBuf::from("/src2")));
     }
+
+    #[test]
+    fn test_classify_import_is_cached() {
+        let mut first_party_modules = IndexSet::new();
+        first_party_modules.insert("module_a".to_owned());
+        let resolver = ModuleResolver {
+            config: Config::default(),
+            module_cache: IndexMap::new(),
+            first_party_modules,
+            virtualenv_packages_cache: RefCell::new(None),
+            import_type_cache: RefCell::new(IndexMap::new()),
+        };
+
+        assert_eq!(resolver.classify_import("module_a"), ImportType::FirstParty);
+        assert_eq!(resolver.classify_import("module_a"), ImportType::FirstParty);
+        assert_eq!(
+            resolver.import_type_cache.borrow().get("module_a"),
+            Some(&ImportType::FirstParty)
+        );
+        assert_eq!(resolver.import_type_cache.borrow().len(), 1);
+    }
 }
@@ -4,6 +4,7 @@
 //! to detect symbol conflicts across modules during bundling.
 
 use anyhow::Result;
+use indexmap::IndexSet;
 use ruff_linter::source_kind::SourceKind;
 use ruff_python_ast::{Expr, ModModule, PySourceType, Stmt};
 use ruff_python_parser::parse_unchecked_source;
@@ -14,6 +15,8 @@ use ruff_python_stdlib::builtins::{MAGIC_GLOBALS, python_builtins};
 use ruff_text_size::{Ranged, TextRange};
 use rustc_hash::FxHashMap as FxIndexMap;
 use rustc_hash::FxHashSet as FxIndexSet;
+use rustc_hash::FxHasher;
+use std::hash::BuildHasherDefault;
 use std::path::Path;
 
 use crate::cribo_graph::ModuleId;
@@ -293,14 +296,54 @@ pub struct ModuleSemanticInfo {
     pub file_path: std::path::PathBuf,
 }
 
+/// Interned handle for a symbol name
+///
+/// Symbol names are interned once in the [`SymbolInterner`] so that registry
+/// lookups and conflict checks compare and hash a single `u32` instead of
+/// the identifier bytes.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+pub struct SymbolId(u32);
+
+/// String interner for symbol names
+#[derive(Debug, Default)]
+pub struct SymbolInterner {
+    /// Interned symbol names; a name's insertion index is its `SymbolId`
+    names: IndexSet<String, BuildHasherDefault<FxHasher>>,
+}
+
+impl SymbolInterner {
+    /// Intern a symbol name, returning the existing id if already known
+    pub fn intern(&mut self, name: &str) -> SymbolId {
+        if let Some(id) = self.get(name) {
+            return id;
+        }
+        let (index, _) = self.names.insert_full(name.to_string());
+        SymbolId(index as u32)
+    }
+
+    /// Look up the id of a symbol name without interning it
+    pub fn get(&self, name: &str) -> Option<SymbolId> {
+        self.names
+            .get_index_of(name)
+            .map(|index| SymbolId(index as u32))
+    }
+
+    /// Resolve an interned id back to its symbol name
+    pub fn resolve(&self, id: SymbolId) -> &str {
+        &self.names[id.0 as usize]
+    }
+}
+
 /// Global symbol registry across all modules with semantic information
 pub struct SymbolRegistry {
-    /// Symbol name -> list of modules that define it
-    pub symbols: FxIndexMap<String, Vec<ModuleId>>,
-    /// Renames: (ModuleId, OriginalName) -> NewName
-    pub renames: FxIndexMap<(ModuleId, String), String>,
+    /// Interner for all symbol names seen by the registry
+    interner: SymbolInterner,
+    /// Symbol -> list of modules that define it
+    pub symbols: FxIndexMap<SymbolId, Vec<ModuleId>>,
+    /// Renames: (ModuleId, OriginalSymbol) -> NewName
+    pub renames: FxIndexMap<(ModuleId, SymbolId), String>,
     /// Symbol binding information for scope analysis
-    pub symbol_bindings: FxIndexMap<(ModuleId, String), SymbolBindingInfo>,
+    pub symbol_bindings: FxIndexMap<(ModuleId, SymbolId), SymbolBindingInfo>,
 }
 
 /// Information about a symbol binding from semantic analysis
@@ -326,6 +369,7 @@ impl SymbolRegistry {
     /// Create a new symbol registry
     pub fn new() -> Self {
         Self {
+            interner: SymbolInterner::default(),
             symbols: FxIndexMap::default(),
             renames: FxIndexMap::default(),
             symbol_bindings: FxIndexMap::default(),
@@ -335,32 +379,32 @@ impl SymbolRegistry {
     /// Register a symbol from a module with semantic information
     pub fn register_symbol_with_binding(
         &mut self,
-        symbol: String,
+        symbol: &str,
         module_id: ModuleId,
         binding_info: SymbolBindingInfo,
     ) {
-        self.symbols
-            .entry(symbol.clone())
-            .or_default()
-            .push(module_id);
+        let symbol_id = self.interner.intern(symbol);
+        self.symbols.entry(symbol_id).or_default().push(module_id);
 
         self.symbol_bindings
-            .insert((module_id, symbol), binding_info);
+            .insert((module_id, symbol_id), binding_info);
     }
 
     /// Register a symbol from a module (legacy interface)
-    pub fn register_symbol(&mut self, symbol: String, module_id: ModuleId) {
-        self.symbols.entry(symbol).or_default().push(module_id);
+    pub fn register_symbol(&mut self, symbol: &str, module_id: ModuleId) {
+        let symbol_id = self.interner.intern(symbol);
+        self.symbols.entry(symbol_id).or_default().push(module_id);
     }
 
     /// Detect conflicts across all modules
     pub fn detect_conflicts(&self) -> Vec<SymbolConflict> {
         let mut conflicts = Vec::new();
 
-        for (symbol, modules) in &self.symbols {
+        for (&symbol_id, modules) in &self.symbols {
             if modules.len() > 1 {
                 conflicts.push(SymbolConflict {
-                    symbol: symbol.clone(),
+                    symbol: self.interner.resolve(symbol_id).to_string(),
+                    symbol_id,
                     modules: modules.clone(),
                 });
             }
@@ -376,23 +420,37 @@ impl SymbolRegistry {
         original: &str,
         suffix: usize,
     ) -> String {
-        let new_name = format!("{}_{}", original, suffix);
+        let symbol_id = self.interner.intern(original);
+        self.generate_rename_for_id(module_id, symbol_id, suffix)
+    }
+
+    /// Generate rename for an already interned conflicting symbol
+    pub fn generate_rename_for_id(
+        &mut self,
+        module_id: ModuleId,
+        symbol_id: SymbolId,
+        suffix: usize,
+    ) -> String {
+        let new_name = format!("{}_{}", self.interner.resolve(symbol_id), suffix);
         self.renames
-            .insert((module_id, original.to_string()), new_name.clone());
+            .insert((module_id, symbol_id), new_name.clone());
         new_name
     }
 
     /// Get rename for a symbol if it exists
     pub fn get_rename(&self, module_id: &ModuleId, original: &str) -> Option<&str> {
+        // Symbols never seen by the interner cannot have been renamed
+        let symbol_id = self.interner.get(original)?;
         self.renames
-            .get(&(*module_id, original.to_string()))
+            .get(&(*module_id, symbol_id))
             .map(|s| s.as_str())
     }
 
     /// Check if a symbol has conflicts
     pub fn has_conflict(&self, symbol: &str) -> bool {
-        self.symbols
+        self.interner
             .get(symbol)
+            .and_then(|symbol_id| self.symbols.get(&symbol_id))
             .is_some_and(|modules| modules.len() > 1)
     }
 
@@ -402,7 +460,8 @@ impl SymbolRegistry {
         module_id: &ModuleId,
         symbol: &str,
     ) -> Option<&SymbolBindingInfo> {
-        self.symbol_bindings.get(&(*module_id, symbol.to_string()))
+        let symbol_id = self.interner.get(symbol)?;
+        self.symbol_bindings.get(&(*module_id, symbol_id))
     }
 
     /// Check if a symbol is module-level in a specific module
@@ -415,6 +474,7 @@ impl SymbolRegistry {
 /// Represents a symbol conflict across modules
 pub struct SymbolConflict {
     pub symbol: String,
+    pub symbol_id: SymbolId,
     pub modules: Vec<ModuleId>,
 }
 
@@ -479,8 +539,7 @@ impl SemanticBundler {
 
         // Register symbols in global registry (simplified for now)
         for symbol in &exported_symbols {
-            self.global_symbols
-                .register_symbol(symbol.clone(), module_id);
+            self.global_symbols.register_symbol(symbol, module_id);
         }
 
         // Store module semantic info
@@ -505,9 +564,9 @@ impl SemanticBundler {
         for conflict in &conflicts {
             for (i, module_id) in conflict.modules.iter().enumerate() {
                 // Generate renames for all modules in conflict (including first)
-                let _new_name = self.global_symbols.generate_rename(
+                let _new_name = self.global_symbols.generate_rename_for_id(
                     *module_id,
-                    &conflict.symbol,
+                    conflict.symbol_id,
                     i + 1, // Start numbering from 1 instead of 0
                 );
 
@@ -655,3 +714,49 @@ impl<'a> GlobalUsageVisitor<'a> {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_symbol_interner_reuses_ids() {
+        let mut interner = SymbolInterner::default();
+
+        let user = interner.intern("User");
+        let product = interner.intern("Product");
+
+        assert_eq!(interner.intern("User"), user);
+        assert_ne!(user, product);
+        assert_eq!(interner.get("Product"), Some(product));
+        assert_eq!(interner.get("process_data"), None);
+        assert_eq!(interner.resolve(user), "User");
+    }
+
+    #[test]
+    fn test_symbol_registry_renames_conflicts() {
+        let mut registry = SymbolRegistry::new();
+        let models = ModuleId::new(0);
+        let entities = ModuleId::new(1);
+
+        registry.register_symbol("User", models);
+        registry.register_symbol("User", entities);
+        registry.register_symbol("Product", models);
+
+        let conflicts = registry.detect_conflicts();
+        assert_eq!(conflicts.len(), 1);
+        assert_eq!(conflicts[0].symbol, "User");
+        assert_eq!(conflicts[0].modules, vec![models, entities]);
+        assert!(registry.has_conflict("User"));
+        assert!(!registry.has_conflict("Product"));
+
+        assert_eq!(
+            registry.generate_rename_for_id(models, conflicts[0].symbol_id, 1),
+            "User_1"
+        );
+        registry.generate_rename(entities, "User", 2);
+        assert_eq!(registry.get_rename(&entities, "User"), Some("User_2"));
+        assert_eq!(registry.get_rename(&models, "User"), Some("User_1"));
+        assert_eq!(registry.get_rename(&models, "API_URL"), None);
+    }
+}
@@ -5,6 +5,9 @@ This file demonstrates how Python modules with global statements
 should be transformed to work correctly when wrapped in init functions.
 """
 
+import types
+from collections.abc import Mapping
+
 # ============================================================================
 # ORIGINAL MODULE (models/base.py)
 # ============================================================================
@@ -65,71 +68,98 @@ def outer():
 # TRANSFORMED MODULE (after bundling)
 # ============================================================================
 
+# Module-level variables are lifted to true module level under unique names,
+# so every read and write inside the wrapper compiles to LOAD_GLOBAL /
+# STORE_GLOBAL instead of a dictionary subscript.
+__cribo_base_result = None
+__cribo_base_counter = None
+__cribo_base_data = None
+
+
+class __CriboLiftedGlobals(Mapping):
+    """Read-only live view of a module's lifted globals, keyed by original name
+
+    Only emitted when user code reflects on `__module_globals__`; the common
+    path never touches it.
+    """
+
+    def __init__(self, prefix, names):
+        self._prefix = prefix
+        self._names = names
+
+    def __getitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+        return globals()[self._prefix + name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
 
 def __cribo_init_module():
     """Wrapper function that encapsulates the module"""
+    global __cribo_base_result, __cribo_base_counter, __cribo_base_data
 
-    # Step 1: Module-level variables become function-local
-    result = "base_result"
-    counter = 0
-    data = {"key": "value"}
-
-    # Step 2: Create module globals dictionary
-    __module_globals__ = {
-        "result": result,
-        "counter": counter,
-        "data": data,
-    }
+    # Step 1: Module-level variables are assigned to their lifted names
+    __cribo_base_result = "base_result"
+    __cribo_base_counter = 0
+    __cribo_base_data = {"key": "value"}
 
-    # Step 3: Transform functions to use the globals dictionary
+    # Step 2: Transform functions to use the lifted globals. The definitions
+    # stay inside the wrapper so module code keeps its original execution
+    # order; the bundle guards each init function with a `sys.modules` check,
+    # so these `def` statements still run only once per process.
 
     def increment():
-        """Transformed: global counter → dictionary access"""
-        # Original: global counter
-        # Original: counter += 1
-        __module_globals__["counter"] += 1
-        return __module_globals__["counter"]
+        """Transformed: global counter → global __cribo_base_counter"""
+        global __cribo_base_counter
+        __cribo_base_counter += 1
+        return __cribo_base_counter
 
     def initialize():
-        """Transformed: multiple globals → dictionary access"""
-        # Original: global result, data
-        # Original: result = f"initialized_{counter}"
-        __module_globals__["result"] = f"initialized_{__module_globals__['counter']}"
-        # Original: data["status"] = "ready"
-        __module_globals__["data"]["status"] = "ready"
-        return __module_globals__["result"]
+        """Transformed: multiple globals → lifted globals"""
+        global __cribo_base_result, __cribo_base_data
+        __cribo_base_result = f"initialized_{__cribo_base_counter}"
+        __cribo_base_data["status"] = "ready"
+        return __cribo_base_result
 
     def get_state():
-        """No transformation needed - reads use dictionary"""
-        return {"result": __module_globals__["result"], "counter": __module_globals__["counter"], "data": __module_globals__["data"]}
+        """Reads need no global declaration - they resolve to the lifted names"""
+        return {"result": __cribo_base_result, "counter": __cribo_base_counter, "data": __cribo_base_data}
+
+    # Methods touching lifted globals are defined outside the class body:
+    # inside it, the compiler would mangle `__cribo_*` to `_Processor__cribo_*`
+    def process(self):
+        global __cribo_base_result
+        __cribo_base_result = f"processed_{__cribo_base_result}"
+        return __cribo_base_result
+
+    def reset(self):
+        global __cribo_base_counter, __cribo_base_data
+        __cribo_base_counter = 0
+        __cribo_base_data = {"key": "value"}
 
     class Processor:
         """Class methods also transformed"""
 
-        def process(self):
-            # Original: global result
-            # Original: result = f"processed_{result}"
-            __module_globals__["result"] = f"processed_{__module_globals__['result']}"
-            return __module_globals__["result"]
-
-        def reset(self):
-            # Original: global counter, data
-            __module_globals__["counter"] = 0
-            __module_globals__["data"] = {"key": "value"}
+    Processor.process = process
+    Processor.reset = reset
 
     def outer():
         x = "outer_local"
 
         def inner():
             # Original: global result
-            __module_globals__["result"] = "inner_modified"
+            global __cribo_base_result
+            __cribo_base_result = "inner_modified"
 
         inner()
         return x
 
-    # Step 4: Create module object and expose values
-    import types
-
+    # Step 3: Create module object and expose values
     module = types.ModuleType("__cribo_wrapped_module")
 
     # Expose functions and classes
@@ -140,43 +170,127 @@ def __cribo_init_module():
     module.outer = outer
 
     # Expose module-level variables (with current values)
-    module.result = __module_globals__["result"]
-    module.counter = __module_globals__["counter"]
-    module.data = __module_globals__["data"]
+    module.result = __cribo_base_result
+    module.counter = __cribo_base_counter
+    module.data = __cribo_base_data
 
-    # Optional: Expose globals dict for debugging
-    module.__module_globals__ = __module_globals__
+    # Only when user code reflects on it: expose a live view of the globals
+    module.__module_globals__ = __CriboLiftedGlobals("__cribo_base_", ("result", "counter", "data"))
 
     return module
 
 
 # ============================================================================
-# ALTERNATIVE: GLOBALS LIFTING APPROACH
+# ALTERNATIVE: NAMESPACE INDIRECTION
 # ============================================================================
 
-# Instead of dictionary, lift globals to true module level with unique names
+# The original scheme kept module-level variables in a dictionary, hashing a
+# string key on every access. The set of module globals is known at bundle
+# time, so a `__slots__` class gives the same indirection with attribute
+# access resolved to fixed slot offsets. It remains slower than lifted globals
+# and is kept here only for comparison.
+
+
+def __cribo_init_module_namespace():
+    """Wrapper function that keeps module globals in a slotted namespace"""
 
-# Generated at true module level
-__cribo_base_result = "base_result"
-__cribo_base_counter = 0
-__cribo_base_data = {"key": "value"}
+    # Step 1: Create the module globals namespace with its fixed schema
+    class _ModGlobals:
+        __slots__ = ("result", "counter", "data")
 
+        def __init__(self):
+            self.result = "base_result"
+            self.counter = 0
+            self.data = {"key": "value"}
 
-def __cribo_init_module_v2():
-    """Alternative approach using lifted globals"""
+        def __getitem__(self, name):
+            # Mapping-style access for code reflecting on __module_globals__
+            if name not in self.__slots__:
+                raise KeyError(name)
+            return getattr(self, name)
+
+    __module_globals__ = _ModGlobals()
+
+    # Step 2: Transform functions to use the globals namespace. Functions
+    # touching it more than once bind it to a local first, so each access is
+    # a LOAD_FAST rather than a closure-cell LOAD_DEREF.
 
     def increment():
-        global __cribo_base_counter
-        __cribo_base_counter += 1
-        return __cribo_base_counter
+        """Transformed: global counter → namespace attribute"""
+        g = __module_globals__
+        # Original: global counter
+        # Original: counter += 1
+        # Keep the new value in a local so the return doesn't look it up again
+        g.counter = counter = g.counter + 1
+        return counter
 
     def initialize():
-        global __cribo_base_result, __cribo_base_data
-        __cribo_base_result = f"initialized_{__cribo_base_counter}"
-        __cribo_base_data["status"] = "ready"
-        return __cribo_base_result
+        """Transformed: multiple globals → namespace attributes"""
+        g = __module_globals__
+        # Original: global result, data
+        # Original: result = f"initialized_{counter}"
+        g.result = f"initialized_{g.counter}"
+        # Original: data["status"] = "ready"
+        g.data["status"] = "ready"
+        return g.result
+
+    def get_state():
+        """No transformation needed - reads use the namespace"""
+        g = __module_globals__
+        r = g.result
+        c = g.counter
+        d = g.data
+        # A dict display is kept as in the original: its keys are constants,
+        # and it is cheaper than dict(zip(keys, values)); a namedtuple would
+        # change what get_state() returns
+        return {"result": r, "counter": c, "data": d}
+
+    class Processor:
+        """Class methods also transformed"""
+
+        def process(self):
+            g = __module_globals__
+            # Original: global result
+            # Original: result = f"processed_{result}"
+            g.result = f"processed_{g.result}"
+            return g.result
+
+        def reset(self):
+            g = __module_globals__
+            # Original: global counter, data
+            g.counter = 0
+            g.data = {"key": "value"}
+
+    def outer():
+        x = "outer_local"
+
+        def inner():
+            # Original: global result
+            # A single access gains nothing from a local binding
+            __module_globals__.result = "inner_modified"
+
+        inner()
+        return x
 
-    # ... rest of implementation
+    # Step 3: Create module object and expose values
+    module = types.ModuleType("__cribo_wrapped_module")
+
+    # Expose functions and classes
+    module.increment = increment
+    module.initialize = initialize
+    module.get_state = get_state
+    module.Processor = Processor
+    module.outer = outer
+
+    # Expose module-level variables (with current values)
+    module.result = __module_globals__.result
+    module.counter = __module_globals__.counter
+    module.data = __module_globals__.data
+
+    # Optional: Expose globals namespace for debugging
+    module.__module_globals__ = __module_globals__
+
+    return module
 
 
 # ============================================================================
@@ -202,7 +316,7 @@ def edge_cases():
 
     # 4. Global with augmented assignment
     global counter
-    counter += 1  # Transform to: __module_globals__['counter'] += 1
+    counter += 1  # Transform to: __cribo_base_counter += 1
 
     # 5. Global in comprehension
     [x for x in range(10) if (global_var := x) > 5]  # Python 3.8+ walrus
@@ -229,8 +343,8 @@ def cross_module_example():
     # shared_global = "modified"
 
     # Transformed:
-    # other_module = sys.modules['__cribo_other_module']
-    # other_module.__module_globals__['shared_global'] = "modified"
+    # global __cribo_other_module_shared_global
+    # __cribo_other_module_shared_global = "modified"
     pass
 
 
@@ -239,14 +353,18 @@ def cross_module_example():
 # ============================================================================
 
 
-def test_transformed_module():
+# Built once and only compared against, never mutated
+_EXPECTED_INITIAL_STATE = {"result": "base_result", "counter": 0, "data": {"key": "value"}}
+
+
+def test_transformed_module(init_module=__cribo_init_module):
     """Verify the transformation preserves semantics"""
 
     # Initialize module
-    module = __cribo_init_module()
+    module = init_module()
 
     # Test 1: Initial state
-    assert module.get_state() == {"result": "base_result", "counter": 0, "data": {"key": "value"}}
+    assert module.get_state() == _EXPECTED_INITIAL_STATE
 
     # Test 2: Increment modifies global
     assert module.increment() == 1
@@ -264,8 +382,8 @@ def test_transformed_module():
     assert module.outer() == "outer_local"
     assert module.__module_globals__["result"] == "inner_modified"
 
-    print("All tests passed!")
-
 
 if __name__ == "__main__":
     test_transformed_module()
+    test_transformed_module(__cribo_init_module_namespace)
+    print("All tests passed!")
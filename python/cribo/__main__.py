@@ -5,16 +5,22 @@ This module provides access to the cribo CLI when called as `python -m cribo`.
 The main interface is the binary `cribo` command.
 """
 
+import os
 import subprocess
 import sys
 
 
 def main() -> None:
     """Main entry point that delegates to the cribo binary."""
+    args = ["cribo"] + sys.argv[1:]
     try:
-        # Call the cribo binary with the same arguments
-        result = subprocess.run(["cribo"] + sys.argv[1:], check=False)
-        sys.exit(result.returncode)
+        if sys.platform == "win32":
+            # Windows has no real exec; os.execvp would detach the child
+            # from the console, so wait for it instead
+            result = subprocess.run(args, check=False)
+            sys.exit(result.returncode)
+        # Replace this process with the cribo binary
+        os.execvp("cribo", args)
     except FileNotFoundError:
         print(
             "cribo binary not found. Please ensure cribo is properly installed.",